@@ -1,12 +1,18 @@
 import logging
+from collections import OrderedDict, defaultdict
 
-from six import string_types
 from .constants import ERROR, WARN, LEVELS
 
 logger = logging.getLogger(__name__)
 
+# How many distinct log lines a ledger remembers in order to not repeat them.
+MAX_ALREADY_LOGGED = 1024
+
 
 class Error(dict):
+    # Errors stay plain dicts for callers, but don't need a per-instance __dict__ or weakref slot on top of that.
+    __slots__ = ()
+
     ERROR = ERROR
     WARN = WARN
 
@@ -23,112 +29,196 @@ class ErrorLedger(object):
             a verbose_name for the field.
         """
         self._errors = []
-        self._is_valid = True
+        # The same Error objects as `_errors`, partitioned by level at write time so the getters need not filter.
+        self._errors_by_level = {level: [] for level in LEVELS}
+        # Formatted `get_descriptive_error_messages` results, one per error seen so far.
+        self._descriptive_error_messages = []
         self._default_object_data = default_object_data if default_object_data is not None else {}
         self._logging = logging
-        self._already_logged = set()
+        self._already_logged = OrderedDict()
         self.validators = validators
 
     @staticmethod
     def create_error_object(message, level, object_data=None):
+        if type(message) is str:
+            # The usual case.
+            new_item = Error({"message": message, "level": level})
+        else:
+            new_item = ErrorLedger._create_error_object_slow(message, level)
+
+        if object_data:
+            new_item.update(object_data)
+
+        return new_item
+
+    @staticmethod
+    def _create_error_object_slow(message, level):
         if isinstance(message, dict):
             assert len(message) == 1, "Don't currently support multi key dicts inside lists."
 
             for field_name, error in message.items():
-                error = "{}: {}".format(field_name, error)
+                error = f"{field_name}: {error}"
                 new_item = Error({"message": error, "field": field_name})
                 break
 
-        elif isinstance(message, string_types):
+        elif isinstance(message, str):
+            # A str subclass.
             new_item = Error({"message": message})
 
         else:
             raise ValueError("Message is required and must be a string or a dict: {}".format(message))
 
         new_item["level"] = level
-        if object_data:
-            new_item.update(object_data)
-
         return new_item
 
     def merge_with(self, other_ledger):
         assert isinstance(other_ledger, ErrorLedger)
 
-        self._errors += other_ledger._errors
-        self._is_valid = self._is_valid and other_ledger._is_valid
-        self._already_logged = self._already_logged.union(other_ledger._already_logged)
+        self._errors.extend(other_ledger._errors)
+        for level, errors in other_ledger._errors_by_level.items():
+            self._errors_by_level.setdefault(level, []).extend(errors)
+        self._already_logged.update(other_ledger._already_logged)
+        while len(self._already_logged) > MAX_ALREADY_LOGGED:
+            self._already_logged.popitem(last=False)
+
+    def add_message(self, message, level, object_data=None, extra_fields=None):
+        """
+        `extra_fields` (optional) are added on top of `object_data`, so callers that only need to add a couple of keys
+            to shared object data don't have to copy it first.
+        """
+        self._record(self._build_error(message, level, object_data, extra_fields))
+
+    def add_messages(self, messages, level, object_data=None, extra_fields=None):
+        """
+        Same as calling `add_message` for each of `messages`, but the new errors are appended in one go.
+
+        `extra_fields` (optional) is a sequence of `extra_fields` for each message (or None), in the same order.
+        """
+        # Bind everything the loop touches to locals, same as `seen_add` in `unique_everseen`.
+        build_error = self._build_error
+        if extra_fields is None:
+            new_items = [build_error(message, level, object_data, None) for message in messages]
+        else:
+            new_items = [
+                build_error(message, level, object_data, extra) for message, extra in zip(messages, extra_fields)
+            ]
+
+        if self._logging and logger.isEnabledFor(logging.DEBUG):
+            log = self._log
+            for new_item in new_items:
+                log(level, new_item["message"])
+
+        self._errors.extend(new_items)
+        self._errors_by_level.setdefault(level, []).extend(new_items)
 
-    def add_message(self, message, level, object_data=None):
-        new_item = self.create_error_object(message, level, object_data)
-        new_item.update(self._default_object_data)
-        self.add_object(new_item)
+    def _build_error(self, message, level, object_data, extra_fields):
+        """
+        The Error for one `add_message`, built as a single dict.  The ledger's defaults lead its keys, same as in
+        `add_object`, but take precedence over `object_data` and `extra_fields`.
+        """
+        default_object_data = self._default_object_data
+        new_item = Error(default_object_data)
+        if type(message) is str:
+            # The usual case.
+            new_item["message"] = message
+            new_item["level"] = level
+        else:
+            new_item.update(self._create_error_object_slow(message, level))
+
+        if object_data:
+            new_item.update(object_data)
+        if extra_fields:
+            new_item.update(extra_fields)
+        if object_data or extra_fields:
+            new_item.update(default_object_data)
+
+        return new_item
 
     def add_object(self, new_item_data):
-        new_item = Error()
-        new_item.update(self._default_object_data)
+        new_item = Error(self._default_object_data)
         new_item.update(new_item_data)
+        if "level" not in new_item or "message" not in new_item:
+            raise KeyError("Errors need a level and a message: {}".format(new_item))
+        self._record(new_item)
 
-        new_item["level"]
-        new_item["message"]
+    def _record(self, new_item):
+        """ Appends a fully-built Error; `add_message` and `add_object` both end up here. """
+        level = new_item["level"]
 
-        if self._logging:
-            log_message = "{} {}".format(new_item["level"], new_item["message"])
-            # It is annoying when it writes the same msg a million times...
-            if log_message not in self._already_logged:
-                logger.debug(log_message)
-                self._already_logged.add(log_message)
+        if self._logging and logger.isEnabledFor(logging.DEBUG):
+            self._log(level, new_item["message"])
 
         self._errors.append(new_item)
-        if new_item["level"] == self.ERROR:
-            self._is_valid = False
+        self._errors_by_level.setdefault(level, []).append(new_item)
+
+    def _log(self, level, message):
+        already_logged = self._already_logged
+        log_message = (level, message)
+        # It is annoying when it writes the same msg a million times...  Only the most recent ones are remembered so
+        # that a long-lived ledger does not grow without bound.
+        if log_message in already_logged:
+            already_logged.move_to_end(log_message)
+        else:
+            logger.debug("%s %s", level, message)
+            already_logged[log_message] = None
+            if len(already_logged) > MAX_ALREADY_LOGGED:
+                already_logged.popitem(last=False)
 
     def get_full_results(self):
         return self._errors
 
     def get_error_messages(self):
-        return list(unique_everseen([e["message"] for e in self._errors if e["level"] == e.ERROR]))
+        return list(dict.fromkeys(e["message"] for e in self._errors_by_level[self.ERROR]))
 
     def get_descriptive_error_messages(self):
-        return list(["{} {}".format(e.get("description"), e["message"]) for e in self._errors if e["level"] == e.ERROR])
+        descriptive = self._descriptive_error_messages
+        # Errors are only ever appended, so only the ones added since the last call need formatting.
+        descriptive.extend(
+            f"{e.get('description')} {e['message']}"
+            for e in self._errors_by_level[self.ERROR][len(descriptive) :]
+        )
+        return list(descriptive)
 
     def get_warning_messages(self):
-        return list(unique_everseen([e["message"] for e in self._errors if e["level"] == e.WARN]))
+        return list(dict.fromkeys(e["message"] for e in self._errors_by_level[self.WARN]))
 
     def get_errors(self, unique=True):
-        errors = [e for e in self._errors if e["level"] == e.ERROR]
+        errors = self._errors_by_level[self.ERROR]
         if unique:
             return ensure_unique_error_list(errors)
         else:
-            return errors
-
+            return list(errors)
 
     def get_warnings(self):
-        return [e for e in self._errors if e["level"] == e.WARN]
+        return list(self._errors_by_level[self.WARN])
+
+    def get_error_count(self):
+        return len(self._errors_by_level[self.ERROR])
+
+    def get_warning_count(self):
+        return len(self._errors_by_level[self.WARN])
 
     def is_valid(self):
-        return self._is_valid
+        return not self._errors_by_level[self.ERROR]
 
     def get_django_validation_formatted_errors(self):
         ret = {}
-        for e in self._errors:
-            field = e.get("field", "non_field_errors")
-            level = e["level"]
-
-            try:
-                d = ret[level]
-            except KeyError:
-                d = ret[level] = {}
-
-            try:
-                d2 = d[field]
-            except KeyError:
-                d2 = d[field] = []
-
-            prefixToRemove = e.get("verbose_name", "") + ": "
-            if e["message"].startswith(prefixToRemove):
-                d2.append(e["message"][len(prefixToRemove) :])
-            else:
-                d2.append(e["message"])
+        for level, errors in self._errors_by_level.items():
+            if not errors:
+                continue
+
+            d = defaultdict(list)
+            for e in errors:
+                message = e["message"]
+                verbose_name = e.get("verbose_name")
+                if verbose_name:
+                    prefixToRemove = verbose_name + ": "
+                    if message.startswith(prefixToRemove):
+                        message = message[len(prefixToRemove) :]
+
+                d[e.get("field", "non_field_errors")].append(message)
+
+            ret[level] = dict(d)
 
         return ret
 
@@ -137,31 +227,34 @@ def unique_everseen(iterable, key=None):
     "List unique elements, preserving order. Remember all elements ever seen."
     # unique_everseen('AAAABBBCCDAABBB') --> A B C D
     # unique_everseen('ABBCcAD', str.lower) --> A B C D
-    from itertools import filterfalse
+    if key is None:
+        # dict.fromkeys does the ordered dedup in C.
+        yield from dict.fromkeys(iterable)
+        return
 
     seen = set()
     seen_add = seen.add
-    if key is None:
-        for element in filterfalse(seen.__contains__, iterable):
-            seen_add(element)
+    for element in iterable:
+        k = key(element)
+        if k not in seen:
+            seen_add(k)
             yield element
-    else:
-        for element in iterable:
-            k = key(element)
-            if k not in seen:
-                seen_add(k)
-                yield element
 
 def ensure_unique_error_list(dict_list):
-    # Use a set to track unique frozensets of dictionary items
+    # Only identical errors are duplicates, whatever order their keys were added in; first one wins.
     seen = set()
     unique_dicts = []
-    
+
     for d in dict_list:
-        # Convert dictionary items to a frozenset
-        items = frozenset(d.items())
-        if items not in seen:
+        try:
+            items = frozenset(d.items())
+            if items in seen:
+                continue
             seen.add(items)
-            unique_dicts.append(d)
-    
-    return unique_dicts
\ No newline at end of file
+        except TypeError:
+            # Some value (e.g. in the provider's object data) is unhashable.
+            if d in unique_dicts:
+                continue
+        unique_dicts.append(d)
+
+    return unique_dicts
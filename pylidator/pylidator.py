@@ -1,13 +1,55 @@
 import logging
-from functools import wraps
-from six import string_types
+import threading
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from logging import DEBUG
 
-from .error_ledger import Error, ErrorLedger
+from .error_ledger import Error, ErrorLedger, unique_everseen
 from . import exceptions
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _default_verbose_name(field_name):
+    """ Default verbose name for a field, e.g. `start_date` -> `Start Date`.  Cached since field names repeat a lot. """
+    from titlecase import titlecase
+
+    return titlecase(" ".join(field_name.split("_")))
+
+
+# Validator results are dispatched on their exact type first; see `_result_kind`.
+_RESULT_KINDS = {str: str, dict: dict}
+
+
+def _result_kind(value):
+    """ `str` or `dict` for those kinds of validator results, None for anything else (an iterable of results). """
+    kind = _RESULT_KINDS.get(type(value))
+    if kind is None:
+        # Subclasses miss the exact type lookup.
+        if isinstance(value, str):
+            kind = str
+        elif isinstance(value, dict):
+            kind = dict
+    return kind
+
+
+def _memoize_field_name_mapper(field_name_mapper):
+    """ Wraps a pure `field_name_mapper` so it only gets called once per (object type, field name). """
+    cache = {}
+
+    def memoized_field_name_mapper(obj, field_name):
+        key = (type(obj), field_name)
+        try:
+            return cache[key]
+        except KeyError:
+            verbose_name = cache[key] = field_name_mapper(obj, field_name)
+            return verbose_name
+
+    return memoized_field_name_mapper
+
+
 def validate(
     obj,
     validators=None,
@@ -18,148 +60,203 @@ def validate(
     logging=True,
     why="",
     include_field_name_in_message=True,
+    max_workers=None,
 ):
     """
     `obj` is the top-level object requiring validation.
-    `validators` is a dict of {level: list of `@pylidator.validator` objects}
-    `providers` is a dict of {of: func that takes obj and returns an iterable of some subobjects}
+    `validators` is a dict of {level: list of `@pylidator.validator` objects}.  It is not modified, so the same dict
+        can be built once and reused across calls.
+    `providers` is a dict of {of: func that takes obj and returns an iterable of some subobjects}, or any object
+        (e.g. a `types.SimpleNamespace` or a module) with those funcs as attributes named after `of`.
     `extra_context` is a dict of other data that can be injected into `@pylidator.validator` with `requires`.
     `field_name_mapper` is a string->string func that converts field names given in returned errors into verbose names.
+        If its result only depends on the type of the object and the field name, set `_pylidator_pure = True` on it
+        and it will only be called once per type and field.
     `validation_type` is added into the error object.
     `logging` If set to False, disables logging of validation results.
     `why` String added to logging to identify the logpoint.
     `include_field_name_in_message` If false, the field name will not be part of the formatted error message.
+    `max_workers` If more than 1, runs the validators concurrently on a thread pool of that size.  Results are
+        still reported in the same order as when running them one at a time.
     """
 
-    ledger = ErrorLedger(default_object_data={"validation_type": validation_type}, logging=logging, validators=validators)
-
-    def _process_validator_results(ret, level, object_data, obj):
-        """ Process the return of a user-supplied `validator`.  Accepts lists, dicts, and strings. """
-
-        # The first object in the tuple is the one being validated
-        if isinstance(obj, tuple):
-            real_obj = obj[0]
-        else:
-            real_obj = obj
+    if getattr(field_name_mapper, "_pylidator_pure", False):
+        field_name_mapper = _memoize_field_name_mapper(field_name_mapper)
+
+    # `logging` is the flag argument here, not the module.  This only covers the summary logged below; the ledgers
+    # check their own logger before logging each error.
+    log_debug = logging and logger.isEnabledFor(DEBUG)
+
+    default_object_data = {"validation_type": validation_type}
+    ledger = ErrorLedger(default_object_data=default_object_data, logging=logging, validators=validators)
+
+    def _collect_field_errors(ret, real_obj, messages, extra_fields):
+        """ Adds one message, and its field and verbose name, per field of a `{field_name: error}` validator result. """
+        for field_name, error in ret.items():
+            # verbose_field_name = ledger.map_field_name_to_verbose_name(obj, field_name)
+            if field_name_mapper is None:
+                # raise RuntimeError("A field_name_mapper was not supplied to this validator.")
+                verbose_name = None
+            else:
+                verbose_name = field_name_mapper(real_obj, field_name)
+            if verbose_name is None:
+                verbose_name = _default_verbose_name(field_name)
+
+            if include_field_name_in_message:
+                error = f"{verbose_name}: {error}"
+            else:
+                error = f"{error}"
+            messages.append(error)
+            extra_fields.append({"field": field_name, "verbose_name": verbose_name})
+
+    def _process_validator_results(ledger, ret, level, object_data, obj):
+        """
+        Process the return of a user-supplied `validator`.  Accepts lists, dicts, and strings.
+
+        `obj` is the object that was validated (the first item, if the provider yielded tuples as rows).
+        """
 
         if not ret:
             is_valid = True
             return is_valid
 
-        if isinstance(ret, string_types):
+        # Anything truthy returned by a validator means it failed.
+        is_valid = False
+
+        kind = _result_kind(ret)
+        if kind is str:
             ledger.add_message(ret, level, object_data)
-            is_valid = False
-
-        elif isinstance(ret, dict):
-            for field_name, error in list(ret.items()):
-                # verbose_field_name = ledger.map_field_name_to_verbose_name(obj, field_name)
-                object_data_with_field = object_data.copy()
-                object_data_with_field["field"] = field_name
-                if field_name_mapper is None:
-                    # raise RuntimeError("A field_name_mapper was not supplied to this validator.")
-                    verbose_name = None
-                else:
-                    verbose_name = field_name_mapper(real_obj, field_name)
-                if verbose_name is None:
-                    from titlecase import titlecase
-
-                    verbose_name = titlecase(" ".join(field_name.split("_")))
-
-                object_data_with_field["verbose_name"] = verbose_name
-                if include_field_name_in_message:
-                    error = "{}: {}".format(verbose_name, error)
-                else:
-                    error = "{}".format(error)
-                ledger.add_message(error, level, object_data_with_field)
-                is_valid = False
+            return is_valid
+
+        # Everything else is gathered up and added to the ledger in one batch.
+        messages = []
+        extra_fields = []
+        if kind is dict:
+            _collect_field_errors(ret, obj, messages, extra_fields)
 
         else:
             for validator_ret_item in ret:
-                if isinstance(validator_ret_item, str):
-                    ledger.add_message(validator_ret_item, level, object_data)
-                    is_valid = False
-                elif isinstance(validator_ret_item, dict):
-                    for field_name, error in list(validator_ret_item.items()):
-                        # verbose_field_name = ledger.map_field_name_to_verbose_name(obj, field_name)
-                        object_data_with_field = object_data.copy()
-                        object_data_with_field["field"] = field_name
-                        verbose_name = field_name_mapper(real_obj, field_name)
-                        if verbose_name is None:
-                            from titlecase import titlecase
-
-                            verbose_name = titlecase(" ".join(field_name.split("_")))
-
-                        object_data_with_field["verbose_name"] = verbose_name
-                        if include_field_name_in_message:
-                            error = "{}: {}".format(verbose_name, error)
-                        else:
-                            error = "{}".format(error)
-
-                        ledger.add_message(error, level, object_data_with_field)
-                        is_valid = False
+                kind = _result_kind(validator_ret_item)
+                if kind is str:
+                    messages.append(validator_ret_item)
+                    extra_fields.append(None)
+                elif kind is dict:
+                    _collect_field_errors(validator_ret_item, obj, messages, extra_fields)
+
+        ledger.add_messages(messages, level, object_data, extra_fields)
 
         return is_valid
 
     # global _cached_provided_items
-    _cached_provided_items = {None: [obj]}
+    _cached_provided_items = {}
+    _cached_provided_items_lock = threading.Lock()
 
     def get_provided_items(of):
+        # Validators may run concurrently (`max_workers`), but each provider should still only be called once.
+        with _cached_provided_items_lock:
+            return _get_provided_items(of)
+
+    def _get_provided_items(of):
         # global _cached_provided_items
 
         if of in _cached_provided_items:
             return _cached_provided_items[of]
 
-        # Already in cache...
-        # if of is None:
-        #     return [obj]
-
-        # Use the correct `provider` to find the child object to process with the validator func.
-        # The provider will generate all child objects and call the validator func once per yielded object.
-        try:
-            generator = providers[of]
-        except (KeyError, TypeError):
-            raise KeyError("Must add `{}` to providers for validator `{}`.".format(of, validator_func_name))
+        if of is None:
+            provided = [obj]
+        else:
+            # Use the correct `provider` to find the child object to process with the validator func.
+            # The provider will generate all child objects and call the validator func once per yielded object.
+            try:
+                generator = providers[of] if isinstance(providers, Mapping) else getattr(providers, of)
+            except (KeyError, TypeError, AttributeError):
+                raise KeyError("Must add `{}` to providers.".format(of))
+            provided = generator(obj)
+
+        # Check the shape once here, so the validators can just unpack the items.
+        ret = []
+        for item in provided:
+            if not isinstance(item, (tuple, list)) or len(item) != 2:
+                raise ValueError("Provider `{}` must yield (row, object_data) 2-tuples, got {}".format(of, item))
+
+            row, object_data = item
+            if object_data is None:
+                object_data = {}
+            else:
+                assert isinstance(
+                    object_data, dict
+                ), "Object data returned from provider must be None or dict of values, but got {}".format(
+                    type(object_data)
+                )
+            ret.append((row, object_data))
 
-        ret = tuple(generator(obj))
         _cached_provided_items[of] = ret
         return ret
 
     validator_func_kwargs = {
-        "process_validator_results": _process_validator_results,
         "extra_context": extra_context,
         "get_provided_items_f": get_provided_items,
     }
 
+    def _run_validator(v, level, validator_ledger):
+        return v(
+            level=level,
+            process_validator_results=partial(_process_validator_results, validator_ledger),
+            **validator_func_kwargs
+        )
+
+    # Every (level, validator) pair to run, in order.  A validator listed twice for the same level only runs once, but
+    # one listed under several levels runs at each of them.
+    validator_runs = [
+        (level, v) for level, level_validators in validators.items() for v in dict.fromkeys(level_validators)
+    ]
+
     validators_applied = []
-    for level, level_validators in validators.items():
-        # assert level in Error.LEVELS, "Level `{}` is not recognized.".format(level)
+    if not max_workers or max_workers == 1:
+        for level, v in validator_runs:
+            is_valid = _run_validator(v, level, ledger)
+            if log_debug:
+                validators_applied.append(f"{v.__name__} {'OK' if is_valid else level}")
+    else:
+        # Every validator records into a ledger of its own; they are merged back in submission order so the results
+        # don't depend on how the threads got scheduled.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            runs = []
+            for level, v in validator_runs:
+                validator_ledger = ErrorLedger(
+                    default_object_data=default_object_data, logging=logging, validators=validators
+                )
+                future = executor.submit(_run_validator, v, level, validator_ledger)
+                runs.append((level, v, validator_ledger, future))
 
-        for v in unique_everseen(level_validators):
-            is_valid = v(level=level, **validator_func_kwargs)
-            validators_applied.append("{} {}".format(v.__name__, "OK" if is_valid else str(level)))
+            for level, v, validator_ledger, future in runs:
+                is_valid = future.result()
+                ledger.merge_with(validator_ledger)
+                if log_debug:
+                    validators_applied.append(f"{v.__name__} {'OK' if is_valid else level}")
 
-    if logging:
+    if log_debug:
         if why:
             why = why.strip() + ": "
         else:
             why = ""
-        if len(ledger.get_errors()) + len(ledger.get_warnings()) == 0:
-            logger.debug(
-                "{}validate complete ({} err, {} warn)".format(
-                    why, len(ledger.get_errors()), len(ledger.get_warnings())
-                )
-            )
+        error_count = ledger.get_error_count()
+        warning_count = ledger.get_warning_count()
+        if error_count + warning_count == 0:
+            logger.debug("%svalidate complete (%d err, %d warn)", why, error_count, warning_count)
         else:
             logger.debug(
-                "{}validate complete ({} err, {} warn): {}".format(
-                    why, len(ledger.get_errors()), len(ledger.get_warnings()), ", ".join(validators_applied)
-                )
+                "%svalidate complete (%d err, %d warn): %s",
+                why,
+                error_count,
+                warning_count,
+                ", ".join(validators_applied),
             )
 
     return ledger
 
 
-def validator(of, requires=None, affects=None):
+def validator(of, requires=None, affects=None, parallel=False):
     """
     Decorator for marking validator functions.
 
@@ -170,8 +267,17 @@ def validator(of, requires=None, affects=None):
          call, containing any items that are used in a `requires`.
     `affects` (optional) is simply passed through to results.  It can be used as guidance for UI/error reporting for
          helping to resolve any resultant errors.
+    `parallel` (optional) calls the validator for all provided items concurrently on a thread pool.  Pass an int to
+         set the number of worker threads.  Only use it for validators that are safe to run concurrently; results are
+         still recorded in the order the provider yielded the items.
     """
 
+    # The decorator arguments never change, so normalize them once rather than every time the validator runs.
+    if isinstance(requires, str):
+        requires_list = requires.split()
+    else:
+        requires_list = list(requires) if requires else []
+
     def decorator(validator_func):
         validator_func_name = validator_func.__name__
 
@@ -181,40 +287,39 @@ def validator(of, requires=None, affects=None):
             `validators`.
             """
             kwargs = {}
-            if requires:
-                if isinstance(requires, string_types):
-                    requires_list = requires.split()
-                else:
-                    requires_list = requires
-                for extra_context_item in requires_list:
-                    try:
-                        kwargs[extra_context_item] = extra_context[extra_context_item]
-                    except (KeyError, TypeError) as exc:
-                        raise exceptions.ContextNotAvailableError(
-                            "{} is not available in the validator context.".format(extra_context_item)
-                        )
+            for extra_context_item in requires_list:
+                try:
+                    kwargs[extra_context_item] = extra_context[extra_context_item]
+                except (KeyError, TypeError) as exc:
+                    raise exceptions.ContextNotAvailableError(
+                        "{} is not available in the validator context.".format(extra_context_item)
+                    )
+
+            rows = get_provided_items_f(of)
 
             # logger.debug(u'Validating {} of {} (of={}).'.format(validator_func, obj, of))
-            is_valid = True
-            for item in get_provided_items_f(of):
-                try:
-                    row, object_data = item
-                except ValueError:
-                    raise ValueError("{} must yield 2-tuples, got {}".format(generator, item))
-                assert object_data is None or isinstance(
-                    object_data, dict
-                ), "Object data returned from provider must be None or dict of values, but got {}".format(
-                    type(object_data)
-                )
+            if parallel:
+                max_workers = None if parallel is True else parallel
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    rets = list(executor.map(lambda row_and_data: validator_func(row_and_data[0], **kwargs), rows))
+                results = zip(rows, rets)
+            else:
+                results = (((row, object_data), validator_func(row, **kwargs)) for row, object_data in rows)
 
-                if object_data is None:
-                    object_data = {}
+            is_valid = True
+            for (row, object_data), ret in results:
+                if not ret:
+                    # Nothing to record, which is what most rows return.
+                    continue
 
                 if affects:
-                    object_data["affects"] = affects
+                    # The provided object data is shared by every validator using this provider, so don't modify it in
+                    # place.  Only the rows that failed need a copy.
+                    object_data = {**object_data, "affects": affects}
 
-                ret = validator_func(row, **kwargs)
-                row_is_valid = process_validator_results(ret, level=level, object_data=object_data, obj=row)
+                # The first object in the tuple is the one being validated
+                real_obj = row[0] if isinstance(row, tuple) else row
+                row_is_valid = process_validator_results(ret, level=level, object_data=object_data, obj=real_obj)
                 if not row_is_valid:
                     is_valid = False
 
@@ -225,38 +330,16 @@ def validator(of, requires=None, affects=None):
     return decorator
 
 
+# Keys that `format_results` prints up front, rather than along with the rest of an error's items.
+_FORMAT_RESULTS_LEADING_KEYS = frozenset(("level", "message", "description"))
+
+
 def format_results(validator_results):
     if validator_results.is_valid():
         return "is valid."
 
     def format_result_item(err):
-        err = err.copy()
+        therest = ", ".join(f"{x}={y}" for x, y in err.items() if x not in _FORMAT_RESULTS_LEADING_KEYS)
+        return f"{err['level']} {err.get('description', '(no description)')} {err['message']} {therest}"
 
-        level = err.pop("level")
-        message = err.pop("message")
-        description = err.pop("description", "(no description)")
-
-        therest = ", ".join("{}={}".format(x, y) for x, y in err.items())
-        return "{} {} {} {}".format(level, description, message, therest)
-
-    return "\n".join((format_result_item(err) for err in validator_results.get_full_results()))
-
-
-def unique_everseen(iterable, key=None):
-    "List unique elements, preserving order. Remember all elements ever seen."
-    # unique_everseen('AAAABBBCCDAABBB') --> A B C D
-    # unique_everseen('ABBCcAD', str.lower) --> A B C D
-    from future.moves.itertools import filterfalse
-
-    seen = set()
-    seen_add = seen.add
-    if key is None:
-        for element in filterfalse(seen.__contains__, iterable):
-            seen_add(element)
-            yield element
-    else:
-        for element in iterable:
-            k = key(element)
-            if k not in seen:
-                seen_add(k)
-                yield element
+    return "\n".join([format_result_item(err) for err in validator_results.get_full_results()])
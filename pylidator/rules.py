@@ -1,8 +1,8 @@
+from operator import attrgetter
+
 from . import messages
 from .utils import yield_all
 
-from six import string_types
-
 
 def any_field_must_be_set(obj, attr, errors):
     """
@@ -15,7 +15,7 @@ def any_field_must_be_set(obj, attr, errors):
     `errors` result list to add any validation messages
     """
 
-    if isinstance(attr, string_types):
+    if isinstance(attr, str):
         field_must_be_set(obj, attr, errors)
     else:
         for item in attr:
@@ -37,10 +37,8 @@ def field_must_be_set(obj, attr, errors):
     `attr` string or iterable of strings to specify attributes to test
     `errors` result list to add any validation messages
     """
-    for item in yield_all(attr):
-        val = getattr(obj, attr)
-        if val is None:
-            errors.append({attr: messages.FIELD_IS_REQUIRED})
+    attrs = tuple(yield_all(attr))
+    errors.extend({item: messages.FIELD_IS_REQUIRED} for item, val in zip(attrs, _getattrs(obj, attrs)) if val is None)
 
 
 def field_must_be_none(obj, attr, errors):
@@ -53,10 +51,10 @@ def field_must_be_none(obj, attr, errors):
     `attr` string or iterable of strings to specify attributes to test
     `errors` result list to add any validation messages
     """
-    for item in yield_all(attr):
-        val = getattr(obj, attr)
-        if val is not None:
-            errors.append({attr: messages.FIELD_MUST_BE_BLANK})
+    attrs = tuple(yield_all(attr))
+    errors.extend(
+        {item: messages.FIELD_MUST_BE_BLANK} for item, val in zip(attrs, _getattrs(obj, attrs)) if val is not None
+    )
 
 
 def date_is_not_after(obj, attr, errors, now, allow_none=False, is_inclusive=False):
@@ -79,3 +77,12 @@ def date_is_not_before(obj, attr, errors, now, allow_none=False, is_inclusive=Fa
 
     if (val == now and not is_inclusive) or val < now:
         errors.append({attr: messages.DATE_IS_NOT_BEFORE})
+
+
+def _getattrs(obj, attrs):
+    """ Values of all of `attrs` on `obj`, in order. """
+    if len(attrs) > 1:
+        return attrgetter(*attrs)(obj)
+
+    # `attrgetter` returns a bare value rather than a 1-tuple for a single attribute.
+    return tuple(getattr(obj, item) for item in attrs)
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pylidator
+
+
+class TestObj:
+    __slots__ = ("it_happened", "returns", "children")
+
+    def __init__(self, returns):
+        self.it_happened = False
+        self.returns = returns
+        self.children = []
+
+
+@pylidator.validator(of="base_obj")
+def validate_parent(obj):
+    obj.it_happened = True
+    return obj.returns
+
+
+@pylidator.validator(of="child_obj")
+def validate_child(obj_child):
+    obj_child.it_happened = True
+    return obj_child.returns
+
+
+@pylidator.validator(of="base_obj", requires="constants_service")
+def validate_parent_with_constants_service(obj_child, constants_service):
+    obj_child.it_happened = True
+    return obj_child.returns
+
+
+_PARENT_ERRORS = {pylidator.ERROR: [validate_parent]}
+_CHILD_ERRORS = {pylidator.ERROR: [validate_child]}
+_CS_ERRORS = {pylidator.ERROR: [validate_parent_with_constants_service]}
+
+
+class MyContext:
+    pass
+
+
+def _provide_base_obj(base_obj):
+    return ((base_obj, None),)
+
+
+def _provide_child_obj(base_obj):
+    for i, c in enumerate(base_obj.children):
+        yield c, {"description": f"Child {i}"}
+
+
+_providers = SimpleNamespace(base_obj=_provide_base_obj, child_obj=_provide_child_obj)
@@ -4,71 +4,48 @@ import pylidator
 from pylidator.exceptions import ContextNotAvailableError
 
 from functools import wraps
-
-
-def child_generator(obj):
-    for row in obj.children:
-        yield row
-
-
-class TestObj(object):
-    def __init__(self, returns):
-        self.it_happened = False
-        self.returns = returns
-        self.children = []
-
-
-@pylidator.validator(of="base_obj")
-def validate_parent(obj):
-    obj.it_happened = True
-    return obj.returns
-
-
-@pylidator.validator(of="child_obj")
-def validate_child(obj_child):
+from types import SimpleNamespace
+
+from ._fixtures import (
+    TestObj,
+    validate_parent,
+    validate_child,
+    MyContext,
+    _providers,
+    _PARENT_ERRORS,
+    _CHILD_ERRORS,
+    _CS_ERRORS,
+)
+
+
+@pylidator.validator(of="child_obj", parallel=2)
+def validate_child_in_parallel(obj_child):
     obj_child.it_happened = True
     return obj_child.returns
 
 
-@pylidator.validator(of="base_obj", requires="constants_service")
-def validate_parent_with_constants_service(obj_child, constants_service):
-    obj_child.it_happened = True
+@pylidator.validator(of="child_obj", affects="returns")
+def validate_child_affecting_returns(obj_child):
     return obj_child.returns
 
 
-class MyContext:
-    pass
-
-
-def _provide_base_obj(base_obj):
-    yield base_obj, None
-
-
-def _provide_child_obj(base_obj):
-    for i, c in enumerate(base_obj.children):
-        yield c, {"description": "Child {}".format(i)}
-
-
-_providers = {"base_obj": _provide_base_obj, "child_obj": _provide_child_obj}
-
-
 class TestPylidator(unittest.TestCase):
     def test_validator_returns_None_results_in_no_error(self):
         data = TestObj(returns=None)
-        ret = pylidator.validate(data, {pylidator.ERROR: [validate_parent]}, providers=_providers)
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
 
         self.assertTrue(data.it_happened)
         self.assertEqual([], ret.get_full_results())
 
     def test_validator_returns_string_results_in_error(self):
         data = TestObj(returns="failed.")
-        ret = pylidator.validate(data, {pylidator.ERROR: [validate_parent]}, providers=_providers)
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
         self.assertTrue(data.it_happened)
         self.assertEqual([{"level": "ERROR", "message": "failed.", "validation_type": None}], ret.get_full_results())
 
     def test_validator_returns_array_of_strings_results_in_errors(self):
         data = TestObj(returns=["error one", "error two"])
-        ret = pylidator.validate(data, {pylidator.ERROR: [validate_parent]}, providers=_providers)
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
         self.assertEqual(
             [
                 {"level": "ERROR", "message": "error one", "validation_type": None},
@@ -85,10 +62,7 @@ class TestPylidator(unittest.TestCase):
         data.children.append(TestObj(returns={"field1": ["Error 1", "Error 2"], "field2": "Error 3"}))
         data.children.append(TestObj(returns=None))
 
-        ret = pylidator.validate(data, {pylidator.ERROR: [validate_child]}, providers=_providers)
-        import pprint
-
-        pprint.pprint(ret.get_full_results())
+        ret = pylidator.validate(data, _CHILD_ERRORS, providers=_providers)
         self.assertEqual(
             [
                 {"description": "Child 0", "level": "ERROR", "message": "hi", "validation_type": None},
@@ -119,7 +93,7 @@ class TestPylidator(unittest.TestCase):
         cs = MyContext()
         ret = pylidator.validate(
             data,
-            {pylidator.ERROR: [validate_parent_with_constants_service]},
+            _CS_ERRORS,
             providers=_providers,
             extra_context={"constants_service": cs},
         )
@@ -132,14 +106,14 @@ class TestPylidator(unittest.TestCase):
         with self.assertRaises(ContextNotAvailableError):
             ret = pylidator.validate(
                 data,
-                {pylidator.ERROR: [validate_parent_with_constants_service]},
+                _CS_ERRORS,
                 providers=_providers,
                 extra_context={"not_constants_service": cs},
             )
 
     def test_validator_returns_array_of_strings_results_in_errors_that_are_unique(self):
         data = TestObj(returns=["error one", "error one"])
-        ret = pylidator.validate(data, {pylidator.ERROR: [validate_parent]}, providers=_providers)
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
         self.assertEqual(
             [
                 {'validation_type': None, 'message': 'error one', 'level': 'ERROR'},
@@ -159,4 +133,161 @@ class TestPylidator(unittest.TestCase):
                 {'validation_type': None, 'message': 'error one', 'level': 'ERROR'}
             ],
             ret.get_errors(unique=False),
-        )
\ No newline at end of file
+        )
+
+    def test_errors_that_only_differ_in_object_data_are_unique(self):
+        data = TestObj(returns=None)
+        for i in range(3):
+            data.children.append(TestObj(returns="broken"))
+
+        def _provide_rows(base_obj):
+            for i, c in enumerate(base_obj.children):
+                yield c, {"row_id": i + 1}
+
+        ret = pylidator.validate(data, _CHILD_ERRORS, providers={"child_obj": _provide_rows})
+        self.assertEqual([1, 2, 3], [e["row_id"] for e in ret.get_errors()])
+
+    def test_unique_errors_with_unhashable_object_data(self):
+        data = TestObj(returns=None)
+        for i in range(3):
+            data.children.append(TestObj(returns="broken"))
+
+        def _provide_rows(base_obj):
+            for i, c in enumerate(base_obj.children):
+                yield c, {"row_ids": [min(i, 1)]}
+
+        ret = pylidator.validate(data, _CHILD_ERRORS, providers={"child_obj": _provide_rows})
+        self.assertEqual([[0], [1]], [e["row_ids"] for e in ret.get_errors()])
+
+    def test_errors_and_warnings_are_reported_by_level(self):
+        data = TestObj(returns="who cares?")
+        data.children.append(TestObj(returns={"field1": "Broken"}))
+        data.children.append(TestObj(returns="warned."))
+
+        ret = pylidator.validate(
+            data, {pylidator.ERROR: [validate_parent], pylidator.WARN: [validate_child]}, providers=_providers
+        )
+        self.assertFalse(ret.is_valid())
+        self.assertEqual(["who cares?"], ret.get_error_messages())
+        self.assertEqual(["Field1: Broken", "warned."], ret.get_warning_messages())
+        self.assertEqual([{"level": "ERROR", "message": "who cares?", "validation_type": None}], ret.get_errors())
+        self.assertEqual(2, len(ret.get_warnings()))
+        self.assertEqual(1, ret.get_error_count())
+        self.assertEqual(2, ret.get_warning_count())
+        self.assertEqual(
+            {
+                "ERROR": {"non_field_errors": ["who cares?"]},
+                "WARN": {"field1": ["Broken"], "non_field_errors": ["warned."]},
+            },
+            ret.get_django_validation_formatted_errors(),
+        )
+
+    def test_parallel_validator_records_results_in_provider_order(self):
+        data = TestObj(returns=None)
+        for i in range(10):
+            data.children.append(TestObj(returns="error {}".format(i)))
+
+        ret = pylidator.validate(data, {pylidator.ERROR: [validate_child_in_parallel]}, providers=_providers)
+        self.assertTrue(all(c.it_happened for c in data.children))
+        self.assertEqual(["error {}".format(i) for i in range(10)], ret.get_error_messages())
+        self.assertEqual("Child 9", ret.get_full_results()[-1]["description"])
+
+    def test_validators_run_on_a_thread_pool_report_results_in_order(self):
+        def _make_data():
+            data = TestObj(returns=["parent one", "parent two"])
+            data.children.append(TestObj(returns="child"))
+            data.children.append(TestObj(returns={"field1": "Broken"}))
+            return data
+
+        validators = {pylidator.ERROR: [validate_child, validate_parent], pylidator.WARN: [validate_parent]}
+        expected = pylidator.validate(_make_data(), validators, providers=_providers).get_full_results()
+        ret = pylidator.validate(_make_data(), validators, providers=_providers, max_workers=3)
+        self.assertEqual(expected, ret.get_full_results())
+        self.assertFalse(ret.is_valid())
+
+    def test_validator_returns_list_of_dicts_without_field_name_mapper(self):
+        data = TestObj(returns=[{"first_name": "Required."}, "Other error."])
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
+        self.assertEqual(
+            [
+                {
+                    "field": "first_name",
+                    "level": "ERROR",
+                    "message": "First Name: Required.",
+                    "validation_type": None,
+                    "verbose_name": "First Name",
+                },
+                {"level": "ERROR", "message": "Other error.", "validation_type": None},
+            ],
+            ret.get_full_results(),
+        )
+
+    def test_format_results(self):
+        data = TestObj(returns=None)
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
+        self.assertEqual("is valid.", pylidator.format_results(ret))
+
+        data.children.append(TestObj(returns={"field1": "Broken"}))
+        data.children.append(TestObj(returns="failed."))
+        ret = pylidator.validate(data, _CHILD_ERRORS, providers=_providers)
+        self.assertEqual(
+            "ERROR Child 0 Field1: Broken validation_type=None, field=field1, verbose_name=Field1\n"
+            "ERROR Child 1 failed. validation_type=None",
+            pylidator.format_results(ret),
+        )
+
+    def test_format_results_lists_object_data_after_the_ledger_defaults(self):
+        data = TestObj(returns=None)
+        data.children.append(TestObj(returns="failed."))
+
+        def _provide_rows(base_obj):
+            for i, c in enumerate(base_obj.children):
+                yield c, {"row_id": i + 1}
+
+        ret = pylidator.validate(data, _CHILD_ERRORS, providers={"child_obj": _provide_rows})
+        self.assertEqual("ERROR (no description) failed. validation_type=None, row_id=1", pylidator.format_results(ret))
+
+    def test_affects_is_only_added_to_its_own_validators_errors(self):
+        data = TestObj(returns=None)
+        data.children.append(TestObj(returns="failed."))
+
+        ret = pylidator.validate(
+            data, {pylidator.ERROR: [validate_child_affecting_returns, validate_child]}, providers=_providers
+        )
+        self.assertEqual(
+            [
+                {
+                    "affects": "returns",
+                    "description": "Child 0",
+                    "level": "ERROR",
+                    "message": "failed.",
+                    "validation_type": None,
+                },
+                {"description": "Child 0", "level": "ERROR", "message": "failed.", "validation_type": None},
+            ],
+            ret.get_full_results(),
+        )
+
+    def test_provider_must_yield_pairs(self):
+        data = TestObj(returns=None)
+        providers = {"base_obj": lambda obj: [obj]}
+        with self.assertRaises(ValueError):
+            pylidator.validate(data, _PARENT_ERRORS, providers=providers)
+
+    def test_providers_can_be_a_dict(self):
+        data = TestObj(returns="failed.")
+        ret = pylidator.validate(data, _PARENT_ERRORS, providers={"base_obj": _providers.base_obj})
+        self.assertEqual(["failed."], ret.get_error_messages())
+
+    def test_missing_provider_raises_key_error(self):
+        data = TestObj(returns=None)
+        with self.assertRaises(KeyError):
+            pylidator.validate(data, _CHILD_ERRORS, providers=SimpleNamespace(base_obj=_providers.base_obj))
+        with self.assertRaises(KeyError):
+            pylidator.validate(data, _CHILD_ERRORS)
+
+    def test_errors_are_logged_when_only_the_ledger_logger_is_enabled(self):
+        data = TestObj(returns="broken")
+        with self.assertLogs("pylidator.error_ledger", level="DEBUG") as logs:
+            pylidator.validate(data, _PARENT_ERRORS, providers=_providers)
+        self.assertEqual(["DEBUG:pylidator.error_ledger:ERROR broken"], logs.output)
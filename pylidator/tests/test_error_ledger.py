@@ -0,0 +1,59 @@
+import copy
+import pickle
+import unittest
+
+from pylidator import ERROR, WARN
+from pylidator.error_ledger import ErrorLedger
+
+
+class Tests(unittest.TestCase):
+    def test_descriptive_error_messages_include_errors_added_after_the_first_call(self):
+        ledger = ErrorLedger()
+        ledger.add_message("first", ERROR, {"description": "Row 1"})
+        ledger.add_message("ignored", WARN, {"description": "Row 1"})
+        self.assertEqual(["Row 1 first"], ledger.get_descriptive_error_messages())
+
+        ledger.add_message("second", ERROR)
+        other = ErrorLedger()
+        other.add_message("third", ERROR, {"description": "Row 3"})
+        ledger.merge_with(other)
+
+        self.assertEqual(["Row 1 first", "None second", "Row 3 third"], ledger.get_descriptive_error_messages())
+        self.assertEqual(["Row 1 first", "None second", "Row 3 third"], ledger.get_descriptive_error_messages())
+
+    def test_deep_copy_records_into_its_own_lists(self):
+        ledger = ErrorLedger()
+        ledger.add_message("first", ERROR)
+
+        ledger_copy = copy.deepcopy(ledger)
+        ledger_copy.add_message("second", ERROR)
+
+        self.assertEqual(["first", "second"], ledger_copy.get_error_messages())
+        self.assertEqual(2, len(ledger_copy.get_full_results()))
+        self.assertEqual(["first"], ledger.get_error_messages())
+        self.assertEqual(1, len(ledger.get_full_results()))
+
+    def test_unique_errors_ignore_key_order(self):
+        ledger = ErrorLedger()
+        ledger.add_object({"level": ERROR, "message": "broken", "field": "x"})
+        ledger.add_object({"field": "x", "message": "broken", "level": ERROR})
+        ledger.add_object({"level": ERROR, "message": "broken", "field": "x", "rows": [1]})
+        ledger.add_object({"rows": [1], "field": "x", "message": "broken", "level": ERROR})
+
+        self.assertEqual(
+            [
+                {"level": ERROR, "message": "broken", "field": "x"},
+                {"level": ERROR, "message": "broken", "field": "x", "rows": [1]},
+            ],
+            ledger.get_errors(),
+        )
+
+    def test_ledger_accepts_extra_attributes_and_pickles(self):
+        ledger = ErrorLedger()
+        ledger.add_message("first", ERROR)
+        ledger.note = "checked by the nightly job"
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(ledger, protocol=protocol))
+            self.assertEqual(["first"], unpickled.get_error_messages())
+            self.assertEqual("checked by the nightly job", unpickled.note)
@@ -5,51 +5,7 @@ from pylidator.exceptions import ContextNotAvailableError
 
 from functools import wraps
 
-
-def child_generator(obj):
-    for row in obj.children:
-        yield row
-
-
-class TestObj(object):
-    def __init__(self, returns):
-        self.it_happened = False
-        self.returns = returns
-        self.children = []
-
-
-@pylidator.validator(of="base_obj")
-def validate_parent(obj):
-    obj.it_happened = True
-    return obj.returns
-
-
-@pylidator.validator(of="child_obj")
-def validate_child(obj_child):
-    obj_child.it_happened = True
-    return obj_child.returns
-
-
-@pylidator.validator(of="base_obj", requires="constants_service")
-def validate_parent_with_constants_service(obj_child, constants_service):
-    obj_child.it_happened = True
-    return obj_child.returns
-
-
-class MyContext:
-    pass
-
-
-def _provide_base_obj(base_obj):
-    yield base_obj, None
-
-
-def _provide_child_obj(base_obj):
-    for i, c in enumerate(base_obj.children):
-        yield c, {"description": "Child {}".format(i)}
-
-
-_providers = {"base_obj": _provide_base_obj, "child_obj": _provide_child_obj}
+from ._fixtures import TestObj, validate_parent, validate_child, _providers, _CHILD_ERRORS
 
 
 class Tests(unittest.TestCase):
@@ -114,3 +70,19 @@ class Tests(unittest.TestCase):
             ret.get_full_results(),
         )
 
+    def test_pure_field_name_mapper_is_called_once_per_field(self):
+        calls = []
+
+        def _custom_field_name_mapper(obj, field_name):
+            calls.append(field_name)
+            return field_name + "_mapped"
+
+        _custom_field_name_mapper._pylidator_pure = True
+
+        data = TestObj(returns=None)
+        data.children.append(TestObj(returns={"field1": "Broken"}))
+        data.children.append(TestObj(returns={"field1": "Broken", "field2": "Also broken"}))
+
+        ret = pylidator.validate(data, _CHILD_ERRORS, providers=_providers, field_name_mapper=_custom_field_name_mapper)
+        self.assertEqual(["field1", "field2"], calls)
+        self.assertEqual(["field1_mapped: Broken", "field2_mapped: Also broken"], ret.get_error_messages())
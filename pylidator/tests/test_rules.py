@@ -0,0 +1,25 @@
+import unittest
+
+from pylidator import messages, rules
+
+
+class Obj(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class Tests(unittest.TestCase):
+    def test_field_must_be_set_checks_each_field(self):
+        errors = []
+        rules.field_must_be_set(Obj(a=1, b=None, c=None), ["a", "b", "c"], errors)
+        self.assertEqual([{"b": messages.FIELD_IS_REQUIRED}, {"c": messages.FIELD_IS_REQUIRED}], errors)
+
+    def test_field_must_be_set_accepts_single_field(self):
+        errors = []
+        rules.field_must_be_set(Obj(a=None), "a", errors)
+        self.assertEqual([{"a": messages.FIELD_IS_REQUIRED}], errors)
+
+    def test_field_must_be_none_checks_each_field(self):
+        errors = []
+        rules.field_must_be_none(Obj(a=1, b=None), ("a", "b"), errors)
+        self.assertEqual([{"a": messages.FIELD_MUST_BE_BLANK}], errors)
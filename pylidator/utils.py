@@ -1,19 +1,24 @@
-from six import string_types
+# Strings are iterable, but `yield_all` treats them as single values.
+_STR_TYPES = (str, bytes)
+
+# {type: whether `yield_all` iterates over values of that type}
+_IS_LIST_LIKE_CACHE = {}
 
 
 def yield_all(str_or_iter):
+    """
+    Returns something to iterate over the items of `str_or_iter`: the iterable itself, or a 1-tuple if it is a string
+    or any other single value.
+    """
     # http://stackoverflow.com/a/11106461/237091
-    def list_like(v):
-        """Return True if v is a non-string sequence and is iterable. Note that
-       not all objects with getitem() have the iterable attribute"""
-        if hasattr(v, "__iter__") and not isinstance(v, string_types):
-            return True
-        else:
-            # This will happen for most atomic types like numbers and strings
-            return False
+    # Note that not all objects with getitem() have the iterable attribute; those count as single values too.  The
+    # answer only depends on the type, and there are only ever a handful of those, so remember it per type.
+    t = type(str_or_iter)
+    list_like = _IS_LIST_LIKE_CACHE.get(t)
+    if list_like is None:
+        list_like = _IS_LIST_LIKE_CACHE[t] = not issubclass(t, _STR_TYPES) and hasattr(t, "__iter__")
+
+    if list_like:
+        return str_or_iter
 
-    if list_like(str_or_iter):
-        for item in str_or_iter:
-            yield item
-    else:
-        yield str_or_iter
+    return (str_or_iter,)